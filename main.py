@@ -7,7 +7,6 @@ Runs the OLX car cover scraper and displays results in table format
 
 import sys
 import argparse
-from src.scraper import OLXScraper
 from src.data_processor import (
     display_results_table, 
     save_to_csv, 
@@ -16,6 +15,7 @@ from src.data_processor import (
     generate_summary_stats
 )
 from src.utils import (
+    setup_logging,
     print_banner, 
     handle_keyboard_interrupt, 
     validate_url, 
@@ -89,6 +89,7 @@ def main():
     try:
         # Parse command line arguments
         args = parse_arguments()
+        setup_logging()
         
         if not args.quiet:
             print_banner()
@@ -102,32 +103,33 @@ def main():
             print("❌ Pages should be between 1 and 10")
             sys.exit(1)
         
-        # Initialize scraper
-        scraper = OLXScraper()
-        
         if not args.quiet:
             print(f"🔍 Starting scrape of: {args.url}")
             print(f"📄 Will scrape {args.pages} page(s)")
             print("⏳ Please wait while we fetch the listings...\n")
         
-        # Scrape or mock
-        raw_listings = []
+        # Scrape or mock (listings are kept as columns until filtering)
+        raw_listings = {'title': [], 'description': [], 'price': []}
         used_mock = False
         if args.mock:
             logger.info("Using mock listings data (no network)")
             raw_listings = generate_mock_listings(n=15)
             used_mock = True
         else:
+            # Imported here so --mock runs skip loading the HTTP/HTML stack
+            from src.scraper import OLXScraper
+            
             logger.info("Starting OLX car cover scraping...")
+            scraper = OLXScraper()
             raw_listings = scraper.scrape_search_results(args.url, max_pages=args.pages)
             # Auto-fallback if scraping fails or yields empty
-            if not raw_listings:
+            if not raw_listings['title']:
                 logger.warning("Scraping returned no results; falling back to mock data")
                 raw_listings = generate_mock_listings(n=15)
                 used_mock = True
         
         # Process the data
-        if raw_listings:
+        if raw_listings['title']:
             # Clean and filter the data
             cleaned_listings = clean_price_data(raw_listings)
             valid_listings = filter_valid_listings(cleaned_listings)
@@ -22,8 +22,17 @@ HEADERS = {
 
 # Scraping settings
 MAX_PAGES_DEFAULT = 2
-REQUEST_DELAY = 2  # seconds between requests
+REQUEST_DELAY = 2  # seconds between requests once the initial burst is spent
+MAX_CONCURRENT_REQUESTS = 3  # pages fetched in parallel from the same host
+MAX_RATE_LIMIT_WAIT = 30  # seconds; give up on a page rather than wait longer for a rate-limit token
 TIMEOUT = 10  # seconds for HTTP requests
+MAX_RETRIES = 5  # retries for transient HTTP failures
+RETRY_BACKOFF_FACTOR = 0.5  # urllib3 waits 0s, 1s, 2s, 4s, 8s between retries
+RETRY_STATUS_CODES = [429, 500, 502, 503, 504]
+
+# HTTP cache settings (requests-cache SQLite backend)
+CACHE_NAME = "olx_cache"  # creates olx_cache.sqlite in the working directory
+CACHE_EXPIRE_AFTER = 3600  # seconds before a cached page is revalidated
 
 # Output settings
 OUTPUT_CSV_FILE = "olx_car_covers.csv"
@@ -5,12 +5,17 @@ Functions for processing, displaying and saving scraped data
 
 """
 
-import pandas as pd
+import csv
+from operator import itemgetter
 from typing import List, Dict
 import logging
 
 logger = logging.getLogger(__name__)
 
+LISTING_COLUMNS = ['title', 'description', 'price']
+INVALID_VALUES = ['N/A', 'Error extracting']
+MISSING_VALUES = frozenset([None, '', *INVALID_VALUES])
+
 
 def display_results_table(listings: List[Dict[str, str]]) -> None:
     """
@@ -23,6 +28,9 @@ def display_results_table(listings: List[Dict[str, str]]) -> None:
         print("No listings found!")
         return
     
+    # pandas is imported lazily so the CSV/non-display paths don't pay for it
+    import pandas as pd
+    
     # Create DataFrame for better table display
     df = pd.DataFrame(listings)
     
@@ -47,65 +55,65 @@ def save_to_csv(listings: List[Dict[str, str]], filename: str = "olx_car_covers.
         filename (str): Output filename
     """
     if listings:
-        df = pd.DataFrame(listings)
-        df.to_csv(filename, index=False, encoding='utf-8')
+        # 1 MiB buffer so rows are flushed in a few large writes; rows go through
+        # the C csv writer as tuples, skipping DictWriter's per-row key checks
+        with open(filename, 'w', newline='', encoding='utf-8', buffering=1 << 20) as f:
+            writer = csv.writer(f, lineterminator='\n')
+            writer.writerow(LISTING_COLUMNS)
+            writer.writerows(map(itemgetter(*LISTING_COLUMNS), listings))
         logger.info(f"Results saved to {filename}")
         print(f"📄 Data saved to {filename}")
     else:
         logger.warning("No data to save")
 
 
-def clean_price_data(listings: List[Dict[str, str]]) -> List[Dict[str, str]]:
+def clean_price_data(listings: Dict[str, List[str]]) -> Dict[str, List[str]]:
     """
     Clean and standardize price data
     
     Args:
-        listings (List[Dict]): Raw listing data
+        listings (Dict[str, List]): Raw listing data as columns
         
     Returns:
-        List[Dict]: Cleaned listing data
+        Dict[str, List]: Cleaned listing data as columns
     """
-    cleaned_listings = []
-    
-    for listing in listings:
-        cleaned_listing = listing.copy()
-        
-        # Clean price field - remove extra whitespace, standardize format
-        price = listing.get('price', '').strip()
-        if price and price != "N/A":
-            # Remove multiple spaces and clean up
-            cleaned_listing['price'] = ' '.join(price.split())
-        
+    return {
         # Clean title and description
-        cleaned_listing['title'] = listing.get('title', '').strip()
-        cleaned_listing['description'] = listing.get('description', '').strip()
-        
-        cleaned_listings.append(cleaned_listing)
-    
-    return cleaned_listings
+        'title': [title.strip() for title in listings['title']],
+        'description': [description.strip() for description in listings['description']],
+        # Clean price field - remove extra whitespace, standardize format
+        'price': [' '.join(price.split()) for price in listings['price']]
+    }
 
 
-def filter_valid_listings(listings: List[Dict[str, str]]) -> List[Dict[str, str]]:
+def filter_valid_listings(listings: Dict[str, List[str]]) -> List[Dict[str, str]]:
     """
     Filter out invalid or incomplete listings
     
+    This is where the columnar pipeline data is turned into one dict per listing
+    for validation, display and saving.
+    
     Args:
-        listings (List[Dict]): Raw listing data
+        listings (Dict[str, List]): Listing data as columns
         
     Returns:
         List[Dict]: Filtered valid listings
     """
-    valid_listings = []
+    titles = listings['title']
+    descriptions = listings['description']
+    prices = listings['price']
     
-    for listing in listings:
-        # Check if listing has essential data
-        if (listing.get('title') and 
-            listing.get('title') not in ['N/A', 'Error extracting'] and
-            len(listing.get('title', '')) > 5):  # Title should be meaningful
-            
-            valid_listings.append(listing)
+    # Keep listings with a meaningful title; records are built only for those rows
+    valid_indices = [
+        i for i, title in enumerate(titles)
+        if len(title) > 5 and title not in INVALID_VALUES
+    ]
+    valid_listings = [
+        {'title': titles[i], 'description': descriptions[i], 'price': prices[i]}
+        for i in valid_indices
+    ]
     
-    logger.info(f"Filtered {len(valid_listings)} valid listings from {len(listings)} total")
+    logger.info(f"Filtered {len(valid_listings)} valid listings from {len(titles)} total")
     return valid_listings
 
 
@@ -119,9 +127,12 @@ def generate_summary_stats(listings: List[Dict[str, str]]) -> None:
     if not listings:
         return
     
-    total_listings = len(listings)
-    listings_with_price = len([l for l in listings if l.get('price') and l['price'] not in ['N/A', 'Error extracting']])
-    listings_with_description = len([l for l in listings if l.get('description') and l['description'] not in ['N/A', 'Error extracting']])
+    # Single pass with counters instead of building a filtered list per stat
+    total_listings = listings_with_price = listings_with_description = 0
+    for listing in listings:
+        total_listings += 1
+        listings_with_price += listing.get('price') not in MISSING_VALUES
+        listings_with_description += listing.get('description') not in MISSING_VALUES
     
     print(f"\n📊 SUMMARY STATISTICS")
     print(f"{'='*40}")
@@ -6,15 +6,89 @@ Contains the main OLXScraper class for scraping car cover listings from OLX.in
 """
 
 import requests
-from bs4 import BeautifulSoup
-import time
-from typing import List, Dict, Optional
+import requests_cache
+from requests.adapters import HTTPAdapter
+from urllib3.util import Retry
+from selectolax.lexbor import LexborHTMLParser
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from typing import List, Dict, Optional, Tuple
 import logging
-from src.utils import setup_logging
-from src.config import HEADERS, BASE_URL, REQUEST_DELAY
+from src.utils import setup_logging, RateLimiter, RateLimitExceeded
+from src.config import (
+    HEADERS, BASE_URL, REQUEST_DELAY, MAX_CONCURRENT_REQUESTS, MAX_RATE_LIMIT_WAIT, TIMEOUT,
+    CACHE_NAME, CACHE_EXPIRE_AFTER, MAX_RETRIES, RETRY_BACKOFF_FACTOR, RETRY_STATUS_CODES,
+    SELECTORS
+)
 
 logger = logging.getLogger(__name__)
 
+# Per-listing field selectors, resolved once at import instead of on every listing
+TITLE_SELECTOR = SELECTORS['title']
+DESCRIPTION_SELECTOR = SELECTORS['description']
+PRICE_SELECTOR = SELECTORS['price']
+
+# Known container layouts in priority order, resolved once at import
+LISTING_CONTAINER_SELECTORS = tuple(SELECTORS['listing_containers'])
+
+
+class ScrapeStopped(requests.RequestException):
+    """
+    Raised for a request abandoned because the scrape it belonged to has stopped
+    """
+
+
+class RateLimitedAdapter(HTTPAdapter):
+    """
+    HTTPAdapter that takes a rate-limit token for every request sent over the network
+    
+    Pages served from the requests-cache never reach the adapter, so cached reruns
+    are not throttled and only live responses can reconfigure the limiter.
+    Requests still waiting for a token when stop_event is set are never sent.
+    """
+    
+    def __init__(self, rate_limiter: RateLimiter, stop_event: threading.Event, **kwargs):
+        """
+        Initialize the adapter
+        
+        Args:
+            rate_limiter (RateLimiter): Limiter shared by all requests to the host
+            stop_event (threading.Event): Set to abandon requests that haven't been sent yet
+            **kwargs: Passed through to HTTPAdapter
+        """
+        self.rate_limiter = rate_limiter
+        self.stop_event = stop_event
+        super().__init__(**kwargs)
+    
+    def send(self, request, **kwargs):
+        """
+        Take a rate-limit token, send the request and let the limiter see the response headers
+        
+        Only the first attempt takes a token: urllib3 retries happen inside
+        super().send() and are paced by the Retry backoff/Retry-After alone, so a 429
+        without Retry-After is retried after 0s.
+        
+        Args:
+            request (PreparedRequest): Request to send
+            **kwargs: Passed through to HTTPAdapter.send
+            
+        Returns:
+            requests.Response from the network
+            
+        Raises:
+            ScrapeStopped: If the scrape stopped while waiting for a token
+            requests.RequestException: If the wait for a token would exceed the limiter's max_wait
+        """
+        try:
+            acquired = self.rate_limiter.acquire(self.stop_event)
+        except RateLimitExceeded as e:
+            raise requests.RequestException(str(e), request=request) from e
+        if not acquired:
+            raise ScrapeStopped(f"Scraping stopped before {request.url} was sent", request=request)
+        response = super().send(request, **kwargs)
+        self.rate_limiter.update_from_headers(response.headers)
+        return response
+
 
 class OLXScraper:
     """
@@ -23,16 +97,48 @@ class OLXScraper:
     
     def __init__(self, base_url: str = BASE_URL):
         """
-        Initialize the scraper with base URL and headers
+        Initialize the scraper with base URL, headers, a cached and retrying
+        HTTP session and a rate limiter
         
         Args:
             base_url (str): Base URL for OLX website
         """
         self.base_url = base_url
         self.headers = HEADERS
+        # Stale entries are revalidated with If-None-Match/If-Modified-Since
+        self.session = requests_cache.CachedSession(CACHE_NAME, expire_after=CACHE_EXPIRE_AFTER)
+        self.session.headers.update(self.headers)
+        
+        # Steady state of one request per REQUEST_DELAY, bursting up to the pool size
+        self.rate_limiter = RateLimiter(
+            rate=1 / REQUEST_DELAY,
+            capacity=MAX_CONCURRENT_REQUESTS,
+            max_wait=MAX_RATE_LIMIT_WAIT
+        )
+        # Set while a scrape is winding down, so its queued page requests are dropped
+        self.stop_event = threading.Event()
+        
+        # Keep-alive pool sized to the worker count so every page thread reuses a
+        # connection; retry transient failures with exponential backoff, honouring Retry-After.
+        # Rate limiting happens in the adapter so cache hits skip it.
+        retry = Retry(
+            total=MAX_RETRIES,
+            backoff_factor=RETRY_BACKOFF_FACTOR,
+            status_forcelist=RETRY_STATUS_CODES,
+            respect_retry_after_header=True
+        )
+        adapter = RateLimitedAdapter(
+            self.rate_limiter,
+            self.stop_event,
+            pool_connections=1,
+            pool_maxsize=MAX_CONCURRENT_REQUESTS,
+            max_retries=retry
+        )
+        self.session.mount('http://', adapter)
+        self.session.mount('https://', adapter)
         setup_logging()
         
-    def fetch_page(self, url: str) -> Optional[BeautifulSoup]:
+    def fetch_page(self, url: str) -> Optional[LexborHTMLParser]:
         """
         Fetch and parse a web page
         
@@ -40,111 +146,160 @@ class OLXScraper:
             url (str): URL to fetch
             
         Returns:
-            BeautifulSoup object or None if failed
+            LexborHTMLParser tree or None if failed
         """
         try:
             logger.info(f"Fetching URL: {url}")
-            response = requests.get(url, headers=self.headers, timeout=10)
+            response = self.session.get(url, timeout=TIMEOUT)
             response.raise_for_status()
+            if getattr(response, 'from_cache', False):
+                logger.info(f"Using cached response for {url}")
             
-            soup = BeautifulSoup(response.content, 'html.parser')
-            return soup
+            tree = LexborHTMLParser(response.content)
+            return tree
             
+        except ScrapeStopped:
+            logger.info(f"Skipped {url}: scraping already stopped")
+            return None
         except requests.RequestException as e:
             logger.error(f"Error fetching {url}: {e}")
             return None
     
-    def extract_listing_data(self, listing_element) -> Dict[str, str]:
+    def extract_listing_data(self, listing_element) -> Tuple[str, str, str]:
         """
         Extract data from a single listing element
         
         Args:
-            listing_element: BeautifulSoup element containing listing data
+            listing_element: LexborNode containing listing data
             
         Returns:
-            Dictionary with title, description, and price
+            Tuple of (title, description, price)
         """
         try:
             # Extract title
-            title_elem = listing_element.find('span', {'data-aut-id': 'itemTitle'})
-            title = title_elem.get_text(strip=True) if title_elem else "N/A"
+            title_elem = listing_element.css_first(TITLE_SELECTOR)
+            title = title_elem.text(strip=True) if title_elem else "N/A"
             
             # Extract description
-            desc_elem = listing_element.find('span', {'data-aut-id': 'itemDescription'})
-            description = desc_elem.get_text(strip=True) if desc_elem else "N/A"
+            desc_elem = listing_element.css_first(DESCRIPTION_SELECTOR)
+            description = desc_elem.text(strip=True) if desc_elem else "N/A"
             
             # Extract price
-            price_elem = listing_element.find('span', {'data-aut-id': 'itemPrice'})
-            price = price_elem.get_text(strip=True) if price_elem else "N/A"
+            price_elem = listing_element.css_first(PRICE_SELECTOR)
+            price = price_elem.text(strip=True) if price_elem else "N/A"
             
-            return {
-                'title': title,
-                'description': description,
-                'price': price
-            }
+            return title, description, price
             
         except Exception as e:
             logger.warning(f"Error extracting listing data: {e}")
-            return {
-                'title': "Error extracting",
-                'description': "Error extracting", 
-                'price': "Error extracting"
-            }
+            return "Error extracting", "Error extracting", "Error extracting"
     
-    def scrape_search_results(self, search_url: str, max_pages: int = 3) -> List[Dict[str, str]]:
+    def build_page_url(self, search_url: str, page: int) -> str:
         """
-        Scrape search results from OLX
+        Build the URL for a given results page
         
         Args:
-            search_url (str): Search URL to scrape
-            max_pages (int): Maximum number of pages to scrape
+            search_url (str): Search URL (page 1)
+            page (int): 1-based page number
             
         Returns:
-            List of dictionaries containing listing data
-        """
-        all_listings = []
-        current_page = 1
-        
-        while current_page <= max_pages:
-            # Construct page URL
-            if current_page == 1:
-                page_url = search_url
-            else:
-                # Add page parameter to URL
-                separator = "&" if "?" in search_url else "?"
-                page_url = f"{search_url}{separator}page={current_page}"
+            URL of the requested page
+        """
+        if page == 1:
+            return search_url
+        
+        # Add page parameter to URL
+        separator = "&" if "?" in search_url else "?"
+        return f"{search_url}{separator}page={page}"
+    
+    def scrape_page(self, page_url: str, page: int) -> Optional[Dict[str, List[str]]]:
+        """
+        Fetch a single results page and extract its listings
+        
+        Args:
+            page_url (str): URL of the results page
+            page (int): 1-based page number (for logging)
             
-            soup = self.fetch_page(page_url)
-            if not soup:
-                logger.error(f"Failed to fetch page {current_page}")
+        Returns:
+            Listing columns ('title', 'description', 'price' -> list of values),
+            or None if the page failed or had no listings
+        """
+        if self.stop_event.is_set():
+            return None
+        
+        tree = self.fetch_page(page_url)
+        if tree is None:
+            if not self.stop_event.is_set():
+                logger.error(f"Failed to fetch page {page}")
+            return None
+        
+        # Find all listing containers - first layout that matches wins
+        listings = []
+        for selector in LISTING_CONTAINER_SELECTORS:
+            listings = tree.css(selector)
+            if listings:
                 break
+        
+        if not listings:
+            logger.warning(f"No listings found on page {page}")
+            return None
             
-            # Find all listing containers - try multiple selectors
-            listings = (
-                soup.find_all('div', {'data-aut-id': 'itemBox'}) or
-                soup.find_all('div', class_=lambda x: x and 'EIR5N' in str(x)) or
-                soup.find_all('li', {'data-aut-id': 'itemBox'})
-            )
+        logger.info(f"Found {len(listings)} listings on page {page}")
+        
+        # Extract data from each listing straight into columns
+        titles, descriptions, prices = [], [], []
+        for listing in listings:
+            title, description, price = self.extract_listing_data(listing)
+            if title != "N/A":  # Only add if we got valid data
+                titles.append(title)
+                descriptions.append(description)
+                prices.append(price)
+        
+        logger.info(f"Extracted {len(titles)} valid listings from page {page}")
+        return {'title': titles, 'description': descriptions, 'price': prices}
+    
+    def scrape_search_results(self, search_url: str, max_pages: int = 3) -> Dict[str, List[str]]:
+        """
+        Scrape search results from OLX
+        
+        Pages are fetched and parsed concurrently (at most MAX_CONCURRENT_REQUESTS
+        at a time) and their listings are collected column-wise in page order.
+        
+        Args:
+            search_url (str): Search URL to scrape
+            max_pages (int): Maximum number of pages to scrape
             
-            if not listings:
-                logger.warning(f"No listings found on page {current_page}")
-                break
+        Returns:
+            Listing columns ('title', 'description', 'price' -> list of values)
+        """
+        all_listings = {'title': [], 'description': [], 'price': []}
+        page_urls = [self.build_page_url(search_url, page) for page in range(1, max_pages + 1)]
+        if not page_urls:
+            return all_listings
+        
+        try:
+            with ThreadPoolExecutor(max_workers=min(MAX_CONCURRENT_REQUESTS, len(page_urls))) as executor:
+                futures = [
+                    executor.submit(self.scrape_page, page_url, page)
+                    for page, page_url in enumerate(page_urls, start=1)
+                ]
                 
-            logger.info(f"Found {len(listings)} listings on page {current_page}")
-            
-            # Extract data from each listing
-            page_listings = []
-            for listing in listings:
-                listing_data = self.extract_listing_data(listing)
-                if listing_data['title'] != "N/A":  # Only add if we got valid data
-                    page_listings.append(listing_data)
-            
-            all_listings.extend(page_listings)
-            logger.info(f"Extracted {len(page_listings)} valid listings from page {current_page}")
-            
-            current_page += 1
-            
-            # Be respectful to the server
-            time.sleep(REQUEST_DELAY)
+                try:
+                    for future in futures:
+                        page_listings = future.result()
+                        if page_listings is None:
+                            break
+                        for column, values in page_listings.items():
+                            all_listings[column].extend(values)
+                finally:
+                    # Don't fetch pages past the first failed/empty one (or after an error or
+                    # Ctrl+C): drop queued pages and wake workers still waiting for a
+                    # rate-limit token so they send nothing
+                    self.stop_event.set()
+                    for future in futures:
+                        future.cancel()
+        finally:
+            # Workers have been joined; later fetches on this scraper may send again
+            self.stop_event.clear()
         
-        return all_listings
\ No newline at end of file
+        return all_listings
@@ -6,11 +6,46 @@ Helper functions and utilities for the OLX scraper
 """
 
 import logging
+import re
 import sys
-from typing import List, Dict
+import threading
+import time
+from typing import List, Dict, Mapping, Optional
 import random
 from src.config import LOGGING_CONFIG
 
+logger = logging.getLogger(__name__)
+
+REQUIRED_LISTING_KEYS = frozenset({'title', 'description', 'price'})
+URL_PATTERN = re.compile(r'https?://[^\s/]+\S*', re.IGNORECASE)
+
+# Mock data pools, each sampled with a single random.choices call per field
+MOCK_TITLES = (
+    "Premium Car Cover for Sedan",
+    "All-Weather SUV Car Body Cover",
+    "Dustproof Hatchback Cover",
+    "Waterproof Car Cover with Mirror Pockets",
+    "UV Protection Car Body Cover",
+    "Heavy Duty Silver Coated Cover",
+    "Compact Car Body Cover",
+    "Outdoor Monsoon Car Cover",
+    "Elastic Fit Car Body Cover",
+    "Breathable Car Cover"
+)
+MOCK_FEATURES = (
+    "Waterproof, UV Protection, Dustproof",
+    "Heavy duty, mirror pockets",
+    "Silver coated, strap & buckle",
+    "All-season protection, soft inner lining",
+    "Anti-scratch, elastic hem",
+    "Includes storage bag",
+    "Triple-stitch seams",
+    "Windproof straps",
+    "Heat resistant",
+    "Lightweight and durable"
+)
+MOCK_PRICES = ("₹ 999", "₹ 1,199", "₹ 1,299", "₹ 1,499", "₹ 1,799", "₹ 1,999", "₹ 2,199")
+
 
 def setup_logging() -> None:
     """
@@ -23,6 +58,99 @@ def setup_logging() -> None:
     )
 
 
+class RateLimitExceeded(Exception):
+    """
+    Raised when the next token would take longer than the limiter's max_wait
+    """
+
+
+class RateLimiter:
+    """
+    Thread-safe token bucket limiting how fast requests are sent to a host
+    """
+    
+    def __init__(self, rate: float, capacity: int = 1, max_wait: Optional[float] = None):
+        """
+        Initialize the bucket full
+        
+        Args:
+            rate (float): Tokens added per second
+            capacity (int): Maximum burst size
+            max_wait (float): Longest wait for a token before giving up (None waits forever)
+        """
+        self.rate = rate
+        self.capacity = capacity
+        self.max_wait = max_wait
+        self._tokens = float(capacity)
+        self._last_refill = time.monotonic()
+        self._configured_from_server = False
+        self._lock = threading.Lock()
+    
+    def acquire(self, stop_event: Optional[threading.Event] = None) -> bool:
+        """
+        Block until a token is available, then consume it
+        
+        Args:
+            stop_event (threading.Event): Optional event that abandons the wait when set
+            
+        Returns:
+            bool: True if a token was taken, False if stop_event was set
+            
+        Raises:
+            RateLimitExceeded: If the wait for a token would exceed max_wait
+        """
+        while True:
+            if stop_event is not None and stop_event.is_set():
+                return False
+            with self._lock:
+                now = time.monotonic()
+                self._tokens = min(self.capacity, self._tokens + (now - self._last_refill) * self.rate)
+                self._last_refill = now
+                if self._tokens >= 1:
+                    self._tokens -= 1
+                    return True
+                wait = (1 - self._tokens) / self.rate
+            if self.max_wait is not None and wait > self.max_wait:
+                raise RateLimitExceeded(
+                    f"Rate limit would delay the next request by {wait:.0f}s (max {self.max_wait:.0f}s)"
+                )
+            if stop_event is None:
+                time.sleep(wait)
+            else:
+                stop_event.wait(wait)
+    
+    def update_from_headers(self, headers: Mapping[str, str]) -> None:
+        """
+        Slow down to the rate advertised by the server's X-RateLimit-* headers
+        (first response only); a generous quota never raises the configured rate
+        
+        Args:
+            headers (Mapping): HTTP response headers
+        """
+        with self._lock:
+            if self._configured_from_server:
+                return
+            self._configured_from_server = True
+            
+            try:
+                remaining = int(headers['X-RateLimit-Remaining'])
+                reset = float(headers['X-RateLimit-Reset'])
+            except (KeyError, ValueError):
+                return
+            
+            # Some servers send an epoch timestamp rather than seconds until reset
+            if reset > 1e9:
+                reset -= time.time()
+            if reset <= 0:
+                return
+            
+            server_rate = max(remaining, 1) / reset
+            if server_rate < self.rate:
+                logger.warning(f"Server rate limit allows {remaining} requests in {reset:.0f}s; slowing down")
+                self.rate = server_rate
+            self._tokens = min(self._tokens, remaining)
+
+
 def validate_url(url: str) -> bool:
     """
     Validate if a URL is properly formatted
@@ -36,8 +164,7 @@ def validate_url(url: str) -> bool:
     if not url or not isinstance(url, str):
         return False
     
-    return True
-    return url.startswith(('http://', 'https://')) and 'olx.in' in url
+    return URL_PATTERN.fullmatch(url) is not None
 
 
 def truncate_text(text: str, max_length: int = 50) -> str:
@@ -54,7 +181,7 @@ def truncate_text(text: str, max_length: int = 50) -> str:
     if not text or len(text) <= max_length:
         return text
     
-    return text[:max_length-3] + "..."
+    return f"{text[:max_length - 3]}..."
 
 
 def print_banner() -> None:
@@ -92,12 +219,9 @@ def validate_listings(listings: List[Dict[str, str]]) -> bool:
     if not listings or not isinstance(listings, list):
         return False
     
-    required_keys = {'title', 'description', 'price'}
-    
+    # dict_keys supports set comparison directly; stop at the first bad row
     for listing in listings:
-        if not isinstance(listing, dict):
-            return False
-        if not required_keys.issubset(listing.keys()):
+        if not isinstance(listing, dict) or not REQUIRED_LISTING_KEYS <= listing.keys():
             return False
     
     return True
@@ -140,44 +264,12 @@ def get_success_message(count: int) -> str:
         return f"Successfully found {count} car cover listings! 🎉"
 
 
-def generate_mock_listings(n: int = 10) -> List[Dict[str, str]]:
-    """
-    Generate mock OLX car cover listings for offline/demo runs.
-    """
-    titles = [
-        "Premium Car Cover for Sedan",
-        "All-Weather SUV Car Body Cover",
-        "Dustproof Hatchback Cover",
-        "Waterproof Car Cover with Mirror Pockets",
-        "UV Protection Car Body Cover",
-        "Heavy Duty Silver Coated Cover",
-        "Compact Car Body Cover",
-        "Outdoor Monsoon Car Cover",
-        "Elastic Fit Car Body Cover",
-        "Breathable Car Cover"
-    ]
-    features = [
-        "Waterproof, UV Protection, Dustproof",
-        "Heavy duty, mirror pockets",
-        "Silver coated, strap & buckle",
-        "All-season protection, soft inner lining",
-        "Anti-scratch, elastic hem",
-        "Includes storage bag",
-        "Triple-stitch seams",
-        "Windproof straps",
-        "Heat resistant",
-        "Lightweight and durable"
-    ]
-    prices = ["₹ 999", "₹ 1,199", "₹ 1,299", "₹ 1,499", "₹ 1,799", "₹ 1,999", "₹ 2,199"]
-
-    listings: List[Dict[str, str]] = []
-    for i in range(n):
-        title = random.choice(titles)
-        desc = random.choice(features)
-        price = random.choice(prices)
-        listings.append({
-            'title': title,
-            'description': desc,
-            'price': price
-        })
-    return listings
\ No newline at end of file
+def generate_mock_listings(n: int = 10) -> Dict[str, List[str]]:
+    """
+    Generate mock OLX car cover listings (as columns) for offline/demo runs.
+    """
+    return {
+        'title': random.choices(MOCK_TITLES, k=n),
+        'description': random.choices(MOCK_FEATURES, k=n),
+        'price': random.choices(MOCK_PRICES, k=n)
+    }